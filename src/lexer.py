@@ -3,6 +3,7 @@
 # For details, see https://github.com/egor-tensin/simple-interpreter.
 # Distributed under the MIT License.
 
+from collections import deque
 import re
 
 from tokens import *
@@ -13,7 +14,7 @@ class LexerError(RuntimeError):
 class Lexer:
     def __init__(self, src_file):
         self._line_buf = ''
-        self._tok_buf = []
+        self._tok_buf = deque()
         self._src_file = src_file
         self._ws_re = re.compile(r'^\s+')
         self._identifier_re = re.compile(r'^[^\W\d]\w*')
@@ -182,15 +183,18 @@ class Lexer:
             raise LexerError("not enough tokens")
         return self._tok_buf[n]
 
+    def tokenize(self):
+        while self._try_eat_token():
+            pass
+        return list(self._tok_buf)
+
     def drop_next_token(self, n = 1):
         if not self.has_next_token(n):
             raise LexerError("not enough tokens")
         if n == 1:
-            return self._tok_buf.pop(0)
+            return self._tok_buf.popleft()
         else:
-            xs = self._tok_buf[:n]
-            self._tok_buf = self._tok_buf[n:]
-            return xs
+            return [self._tok_buf.popleft() for i in range(n)]
 
 if __name__ == '__main__':
     import argparse
@@ -3,143 +3,191 @@
 # For details, see https://github.com/egor-tensin/simple-interpreter.
 # Distributed under the MIT License.
 
-class ProgramNode:
+class Node:
+    def children(self):
+        return []
+
+_varmap = { }
+
+def _execute_stmt(stmt, observer):
+    if observer is not None:
+        observer(stmt)
+    return stmt.execute(observer)
+
+class ProgramNode(Node):
     def __init__(self, stmt_list):
         self._stmt_list = stmt_list
 
-    def execute(self):
-        for stmt in self._stmt_list:
-            stmt.execute()
+    def children(self):
+        return list(self._stmt_list)
 
-_varmap = { }
+    def execute(self, observer=None):
+        for stmt in self._stmt_list:
+            _execute_stmt(stmt, observer)
 
-class CompoundStatementNode:
+class CompoundStatementNode(Node):
     def __init__(self, stmt_list):
         self._stmt_list = stmt_list
 
-    def execute(self):
+    def children(self):
+        return list(self._stmt_list)
+
+    def execute(self, observer=None):
         for stmt in self._stmt_list:
-            stmt.execute()
+            _execute_stmt(stmt, observer)
 
-class EmptyStatementNode:
-    def execute(self):
+class EmptyStatementNode(Node):
+    def execute(self, observer=None):
         pass
 
-class AssignmentNode:
+class AssignmentNode(Node):
     def __init__(self, identifier, arithm_expr):
         self._identifier = identifier
         self._arithm_expr = arithm_expr
 
-    def execute(self):
+    def children(self):
+        return [self._arithm_expr]
+
+    def execute(self, observer=None):
         _varmap[str(self._identifier)] = self._arithm_expr.execute()
         return None
 
-class PrintStatementNode:
+class PrintStatementNode(Node):
     def __init__(self, arithm_expr):
         self._arithm_expr = arithm_expr
 
-    def execute(self):
+    def children(self):
+        return [self._arithm_expr]
+
+    def execute(self, observer=None):
         print(self._arithm_expr.execute())
         return None
 
-class IdentifierNode:
+class IdentifierNode(Node):
     def __init__(self, identifier):
         self._identifier = identifier
 
     def execute(self):
         return _varmap[str(self._identifier)]
 
-class AdditionOpNode:
+class AdditionOpNode(Node):
     def __init__(self, left, right):
         self._left = left
         self._right = right
 
+    def children(self):
+        return [self._left, self._right]
+
     def execute(self):
         return self._left.execute() + self._right.execute()
 
-class SubtractionOpNode:
+class SubtractionOpNode(Node):
     def __init__(self, left, right):
         self._left = left
         self._right = right
 
+    def children(self):
+        return [self._left, self._right]
+
     def execute(self):
         return self._left.execute() + self._right.execute()
 
-class MultiplicationOpNode:
+class MultiplicationOpNode(Node):
     def __init__(self, left, right):
         self._left = left
         self._right = right
 
+    def children(self):
+        return [self._left, self._right]
+
     def execute(self):
         return self._left.execute() * self._right.execute()
 
-class DivisionOpNode:
+class DivisionOpNode(Node):
     def __init__(self, left, right):
         self._left = left
         self._right = right
 
+    def children(self):
+        return [self._left, self._right]
+
     def execute(self):
         return self._left.execute() / self._right.execute()
 
-class IntegerNumberNode:
+class IntegerNumberNode(Node):
     def __init__(self, n):
         self._n = n
 
     def execute(self):
         return int(self._n)
 
-class FloatingPointNumberNode:
+class FloatingPointNumberNode(Node):
     def __init__(self, n):
         self._n = n
 
     def execute(self):
         return float(self._n)
 
-class IfStatementNode:
+class IfStatementNode(Node):
     def __init__(self, cond, body):
         self._cond = cond
         self._body = body
 
-    def execute(self):
+    def children(self):
+        return [self._cond, self._body]
+
+    def execute(self, observer=None):
         if self._cond.execute():
-            return self._body.execute()
+            return _execute_stmt(self._body, observer)
 
-class TrueNode:
+class TrueNode(Node):
     def execute(self):
         return True
 
-class FalseNode:
+class FalseNode(Node):
     def execute(self):
         return False
 
-class AndOpNode:
+class AndOpNode(Node):
     def __init__(self, left, right):
         self._left = left
         self._right = right
 
+    def children(self):
+        return [self._left, self._right]
+
     def execute(self):
         return self._left.execute() and self._right.execute()
 
-class OrOpNode:
+class OrOpNode(Node):
     def __init__(self, left, right):
         self._left = left
         self._right = right
 
+    def children(self):
+        return [self._left, self._right]
+
     def execute(self):
         return self._left.execute() or self._right.execute()
 
-class EqualsOpNode:
+class EqualsOpNode(Node):
     def __init__(self, left, right):
         self._left = left
         self._right = right
 
+    def children(self):
+        return [self._left, self._right]
+
     def execute(self):
         return self._left.execute() == self._right.execute()
 
-class NotEqualsOpNode:
+class NotEqualsOpNode(Node):
     def __init__(self, left, right):
         self._left = left
         self._right = right
 
+    def children(self):
+        return [self._left, self._right]
+
     def execute(self):
         return self._left.execute() != self._right.execute()
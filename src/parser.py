@@ -13,6 +13,9 @@ class Parser:
     def __init__(self, src_file):
         self._lexer = Lexer(src_file)
 
+    def tokenize(self):
+        return self._lexer.tokenize()
+
     def parse(self):
         return self._parse_program()
 
@@ -187,11 +190,40 @@ class Parser:
         else:
             raise ParserError('expected an identifier, a number or \'(\'')
 
+def interpret(src_file, stats=None):
+    parser = Parser(src_file)
+    if stats is None:
+        parser.parse().execute()
+        return
+    with stats.measure_phase('lexing'):
+        tokens = parser.tokenize()
+    stats.count_tokens(tokens)
+    with stats.measure_phase('parsing'):
+        program = parser.parse()
+    stats.count_nodes(program)
+    with stats.measure_phase('execution'):
+        program.execute(stats.stmt_executed)
+
 if __name__ == '__main__':
     import argparse
+    import sys
+    from stats import Stats
     parser = argparse.ArgumentParser()
     parser.add_argument('src_path', help='set source file path')
+    parser.add_argument('--stats', nargs='?', const='text',
+                        choices=('text', 'json'),
+                        help='print per-phase statistics to stderr')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='also measure peak memory per phase '
+                             '(slows down every phase)')
     args = parser.parse_args()
-    with open(args.src_path, 'r') as src_file:
-        parser = Parser(src_file)
-        parser.parse().execute()
+    stats = None if args.stats is None else Stats(args.trace_memory)
+    try:
+        with open(args.src_path, 'r') as src_file:
+            interpret(src_file, stats)
+    finally:
+        if stats is not None:
+            if args.stats == 'json':
+                print(stats.to_json(), file=sys.stderr)
+            else:
+                print(stats.to_text(), file=sys.stderr)
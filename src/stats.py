@@ -0,0 +1,124 @@
+# Copyright (c) 2015 Egor Tensin <Egor.Tensin@gmail.com>
+# This file is part of the "Simple interpreter" project.
+# For details, see https://github.com/egor-tensin/simple-interpreter.
+# Distributed under the MIT License.
+
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+import json
+import time
+import tracemalloc
+
+class PhaseStats:
+    def __init__(self, name):
+        self.name = name
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.peak_memory = None
+
+    def to_dict(self):
+        return OrderedDict([
+            ('wall_time', self.wall_time),
+            ('cpu_time', self.cpu_time),
+            ('peak_memory', self.peak_memory),
+        ])
+
+class Stats:
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.phases = OrderedDict()
+        self.token_counts = Counter()
+        self.node_counts = Counter()
+        self.stmt_counts = Counter()
+        self._phase_callbacks = []
+        self._stmt_callbacks = []
+
+    def add_phase_callback(self, callback):
+        self._phase_callbacks.append(callback)
+
+    def add_stmt_callback(self, callback):
+        self._stmt_callbacks.append(callback)
+
+    @contextmanager
+    def measure_phase(self, name):
+        phase = PhaseStats(name)
+        # If somebody else is already tracing, their peak can't be reset
+        # without clobbering it, so the phase peak is left unknown.
+        started_tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield phase
+        finally:
+            phase.cpu_time = time.process_time() - cpu_start
+            phase.wall_time = time.perf_counter() - wall_start
+            if started_tracing:
+                _, phase.peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+            self.phases[name] = phase
+            for callback in self._phase_callbacks:
+                callback(phase)
+
+    def count_tokens(self, tokens):
+        for t in tokens:
+            self.token_counts[t.__class__.__name__] += 1
+
+    def count_nodes(self, root):
+        pending = [root]
+        while pending:
+            node = pending.pop()
+            self.node_counts[node.__class__.__name__] += 1
+            pending.extend(node.children())
+
+    def stmt_executed(self, stmt):
+        self.stmt_counts[stmt.__class__.__name__] += 1
+        for callback in self._stmt_callbacks:
+            callback(stmt)
+
+    def to_dict(self):
+        return OrderedDict([
+            ('memory_traced', self.trace_memory),
+            ('phases', OrderedDict(
+                (name, phase.to_dict())
+                for name, phase in self.phases.items())),
+            ('tokens', OrderedDict([
+                ('total', sum(self.token_counts.values())),
+                ('by_kind', OrderedDict(sorted(self.token_counts.items()))),
+            ])),
+            ('nodes', OrderedDict([
+                ('total', sum(self.node_counts.values())),
+                ('by_class', OrderedDict(sorted(self.node_counts.items()))),
+            ])),
+            ('executed_stmts', OrderedDict([
+                ('total', sum(self.stmt_counts.values())),
+                ('by_class', OrderedDict(sorted(self.stmt_counts.items()))),
+            ])),
+        ])
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_text(self):
+        lines = []
+        if self.trace_memory:
+            lines.append('memory tracing on, times include its overhead')
+        lines.append('%-10s %12s %12s %14s' % (
+                'phase', 'wall (s)', 'cpu (s)', 'peak mem (B)'))
+        for phase in self.phases.values():
+            if phase.peak_memory is None:
+                peak_memory = 'n/a'
+            else:
+                peak_memory = str(phase.peak_memory)
+            lines.append('%-10s %12.6f %12.6f %14s' % (
+                    phase.name, phase.wall_time, phase.cpu_time,
+                    peak_memory))
+        for title, counts in (
+                ('tokens', self.token_counts),
+                ('nodes', self.node_counts),
+                ('executed statements', self.stmt_counts)):
+            lines.append('%s: %d' % (title, sum(counts.values())))
+            for name, n in sorted(counts.items()):
+                lines.append('    %-28s %d' % (name, n))
+        return '\n'.join(lines)